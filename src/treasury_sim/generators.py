@@ -10,28 +10,179 @@ and anomalies that mirror real-world treasury operations.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
+from itertools import repeat
+from typing import Optional, List, Tuple, Union
+from numpy.typing import DTypeLike
+import os
 import random
 import string
+import warnings
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; only needed for backend='polars'
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; only needed for write_cash_flows_parquet
+    pa = pq = None
+
+
+# Anything np.random.default_rng accepts as an explicit stream for a generator
+RandomSource = Union[np.random.Generator, np.random.SeedSequence]
+
+# Generators with a backend option return one of these
+Frame = Union[pd.DataFrame, 'pl.DataFrame']
 
 
 def set_seed(seed: int = 42):
-    """Set random seed for reproducibility."""
+    """
+    Set the global random seed.
+
+    Deprecated: generators no longer read global random state. Pass ``seed``
+    (or ``rng``) to each generator instead.
+    """
+    warnings.warn(
+        'set_seed() no longer affects the generators; pass seed= or rng= to each generator instead',
+        DeprecationWarning,
+        stacklevel=2
+    )
     np.random.seed(seed)
     random.seed(seed)
 
 
+def _get_rng(seed: int, rng: Optional[RandomSource] = None) -> np.random.Generator:
+    """Return the generator a single call draws from: ``rng`` if given, else a fresh stream for ``seed``."""
+    if rng is None:
+        rng = np.random.SeedSequence(seed)
+    return np.random.default_rng(rng)
+
+
+def _format_ids(prefix: str, numbers: np.ndarray, width: int) -> np.ndarray:
+    """Format integers as zero-padded ids, e.g. ('TXN_', 1000, 8) -> 'TXN_00001000', in one vectorized pass."""
+    digits = np.asarray(numbers).astype(str)
+    if digits.size == 0:  # np.char.zfill cannot size an empty result
+        return digits
+    return np.char.add(prefix, np.char.zfill(digits, width))
+
+
+def _round_amounts(values: np.ndarray, decimals: int, dtype: DTypeLike = np.float64) -> np.ndarray:
+    """
+    Round values to decimals and cast them to dtype.
+
+    Rounding happens in float64 before the cast, so float32 output holds the
+    nearest float32 to each rounded value. float32 keeps only ~7 significant
+    digits: cents stop being exact above roughly 100,000, so keep float64 for
+    treasury-grade figures.
+    """
+    return np.round(values, decimals).astype(dtype, copy=False)
+
+
+def _build_frame(columns: dict, backend: str = 'pandas') -> Frame:
+    """
+    Build the output frame from a dict of column arrays.
+
+    backend='pandas' wraps the arrays without copying. backend='polars' builds
+    a polars DataFrame directly from the arrays; Categorical columns become
+    polars Enum columns with the same categories.
+    """
+    if backend == 'pandas':
+        return pd.DataFrame(columns, copy=False)
+    if backend != 'polars':
+        raise ValueError(f"backend must be 'pandas' or 'polars', got {backend!r}")
+    if pl is None:
+        raise ImportError("backend='polars' requires the polars package")
+
+    series = []
+    for name, values in columns.items():
+        if isinstance(values, pd.Categorical):
+            # Gather the integer codes from a one-row-per-category Enum series,
+            # so no label is built per row; code -1 (missing) becomes null
+            enum = pl.Enum(list(values.categories))
+            codes = values.codes
+            column = pl.Series(name, list(values.categories), dtype=enum).gather(np.maximum(codes, 0))
+            missing = np.flatnonzero(codes < 0)
+            series.append(column.scatter(missing, None) if len(missing) else column)
+        else:
+            values = np.asarray(values)
+            if values.dtype.kind in 'UO':
+                # polars reads str objects faster than it decodes fixed-width
+                # 'U' arrays. An object array starting with None would be
+                # inferred as Object, so that one is passed as a list.
+                values = values.astype(object, copy=False)
+                if len(values) and values[0] is None:
+                    values = values.tolist()
+                series.append(pl.Series(name, values, dtype=pl.String))
+            else:
+                series.append(pl.Series(name, values))
+    return pl.DataFrame(series)
+
+
+def _random_tokens(rng: np.random.Generator, alphabet: str, n: int, length: int) -> np.ndarray:
+    """Draw n random strings of length characters from alphabet as one fixed-width string array."""
+    chars = np.array(list(alphabet), dtype='U1')
+    return chars[rng.integers(0, len(chars), size=(n, length))].view(f'U{length}').ravel()
+
+
+def _date_range(start: datetime, periods: int, unit: str = 'D') -> np.ndarray:
+    """Return periods timestamps spaced one unit ('D' or 'h') apart from start, as a datetime64[ns] array."""
+    return np.datetime64(start, 'ns') + np.arange(periods).astype(f'timedelta64[{unit}]')
+
+
+def _calendar_fields(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (day_of_month, weekday, month) for each datetime64 date as int8 arrays, with Monday as weekday 0."""
+    days = dates.astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    return (
+        ((days - months).astype(np.int64) + 1).astype(np.int8),
+        ((days.astype(np.int64) + 3) % 7).astype(np.int8),  # 1970-01-01 was a Thursday
+        (months.astype(np.int64) % 12 + 1).astype(np.int8)
+    )
+
+
+def _draw_categorical(
+    rng: np.random.Generator,
+    categories: List[str],
+    size: int,
+    p: Optional[List[float]] = None
+) -> pd.Categorical:
+    """Draw ``size`` values from ``categories`` as a Categorical built straight from integer codes."""
+    return pd.Categorical.from_codes(rng.choice(len(categories), size=size, p=p), categories)
+
+
 # =============================================================================
 # CASH FLOW DATA GENERATORS
 # =============================================================================
 
+# Cash flow descriptions, one per category (RECEIVABLE, INTEREST, SUPPLIER,
+# SALARY, TAX) so that a category code is also the description code
+DESCRIPTIONS = pd.CategoricalDtype([
+    'Customer payment - Invoice', 'Monthly interest income', 'Supplier payment',
+    'Monthly payroll', 'Quarterly tax payment'
+])
+
+
 def generate_cash_flows(
     days: int = 365,
     n_accounts: int = 5,
     base_date: Optional[datetime] = None,
-    seed: int = 42
-) -> pd.DataFrame:
+    seed: int = 42,
+    rng: Optional[RandomSource] = None,
+    backend: str = 'pandas',
+    amount_dtype: DTypeLike = np.float64
+) -> Frame:
     """
     Generate realistic cash flow transaction data.
 
@@ -51,203 +202,382 @@ def generate_cash_flows(
         Start date (defaults to today minus days)
     seed : int
         Random seed for reproducibility
+    rng : np.random.Generator or np.random.SeedSequence, optional
+        Random stream to draw from instead of seed, e.g. a child sequence
+        spawned per worker process
+    backend : str
+        'pandas' (default) or 'polars' to return a polars DataFrame
+    amount_dtype : numpy dtype
+        dtype of the amount columns (default float64). float32 halves their
+        memory but keeps only ~7 significant digits; see _round_amounts
 
     Returns:
     --------
-    pd.DataFrame with columns:
+    DataFrame with columns:
         date, account_id, transaction_id, type, amount, currency,
         category, counterparty, description, is_recurring
     """
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
     if base_date is None:
         base_date = datetime.now() - timedelta(days=days)
 
-    data = []
-    transaction_id = 1000
-
     # Define account currencies
-    account_currencies = {
-        f'ACC_{i:03d}': np.random.choice(['USD', 'EUR', 'TRY'], p=[0.4, 0.3, 0.3])
-        for i in range(n_accounts)
-    }
+    account_currencies = _draw_categorical(rng, ['USD', 'EUR', 'TRY'], n_accounts, p=[0.4, 0.3, 0.3])
 
-    for day_offset in range(days):
-        current_date = base_date + timedelta(days=day_offset)
-        day_of_month = current_date.day
-        day_of_week = current_date.weekday()
-        month = current_date.month
-
-        # Skip weekends for most transactions
-        is_weekend = day_of_week >= 5
-
-        for account_idx in range(n_accounts):
-            account_id = f'ACC_{account_idx:03d}'
-            currency = account_currencies[account_id]
-
-            # Month-end effect (more transactions)
-            month_end_multiplier = 2.0 if day_of_month >= 25 else 1.0
-
-            # Quarter-end effect
-            quarter_end_multiplier = 1.5 if month in [3, 6, 9, 12] and day_of_month >= 20 else 1.0
-
-            # INFLOWS
-            if not is_weekend:
-                # Customer receivables (larger, less frequent)
-                if np.random.random() < 0.3 * month_end_multiplier:
-                    amount = np.random.lognormal(mean=12, sigma=1.5)  # ~$150K avg
-                    data.append({
-                        'date': current_date,
-                        'account_id': account_id,
-                        'transaction_id': f'TXN_{transaction_id:08d}',
-                        'type': 'INFLOW',
-                        'amount': round(amount, 2),
-                        'currency': currency,
-                        'category': 'RECEIVABLE',
-                        'counterparty': f'CUST_{np.random.randint(1, 50):03d}',
-                        'description': f'Customer payment - Invoice',
-                        'is_recurring': False
-                    })
-                    transaction_id += 1
-
-                # Interest income (small, regular)
-                if day_of_month == 1:
-                    amount = np.random.uniform(5000, 50000)
-                    data.append({
-                        'date': current_date,
-                        'account_id': account_id,
-                        'transaction_id': f'TXN_{transaction_id:08d}',
-                        'type': 'INFLOW',
-                        'amount': round(amount, 2),
-                        'currency': currency,
-                        'category': 'INTEREST',
-                        'counterparty': 'BANK_INTEREST',
-                        'description': 'Monthly interest income',
-                        'is_recurring': True
-                    })
-                    transaction_id += 1
-
-            # OUTFLOWS
-            if not is_weekend:
-                # Supplier payments (multiple per day)
-                n_supplier_payments = int(np.random.poisson(3) * month_end_multiplier)
-                for _ in range(n_supplier_payments):
-                    amount = np.random.lognormal(mean=10, sigma=1.2)  # ~$20K avg
-                    data.append({
-                        'date': current_date,
-                        'account_id': account_id,
-                        'transaction_id': f'TXN_{transaction_id:08d}',
-                        'type': 'OUTFLOW',
-                        'amount': -round(amount, 2),
-                        'currency': currency,
-                        'category': 'SUPPLIER',
-                        'counterparty': f'SUPP_{np.random.randint(1, 200):03d}',
-                        'description': 'Supplier payment',
-                        'is_recurring': False
-                    })
-                    transaction_id += 1
-
-                # Salary payments (end of month)
-                if day_of_month == 28:
-                    amount = np.random.uniform(500000, 2000000)
-                    data.append({
-                        'date': current_date,
-                        'account_id': account_id,
-                        'transaction_id': f'TXN_{transaction_id:08d}',
-                        'type': 'OUTFLOW',
-                        'amount': -round(amount, 2),
-                        'currency': currency,
-                        'category': 'SALARY',
-                        'counterparty': 'PAYROLL',
-                        'description': 'Monthly payroll',
-                        'is_recurring': True
-                    })
-                    transaction_id += 1
-
-                # Tax payments (quarterly)
-                if month in [1, 4, 7, 10] and day_of_month == 15:
-                    amount = np.random.uniform(100000, 500000) * quarter_end_multiplier
-                    data.append({
-                        'date': current_date,
-                        'account_id': account_id,
-                        'transaction_id': f'TXN_{transaction_id:08d}',
-                        'type': 'OUTFLOW',
-                        'amount': -round(amount, 2),
-                        'currency': currency,
-                        'category': 'TAX',
-                        'counterparty': 'TAX_AUTHORITY',
-                        'description': 'Quarterly tax payment',
-                        'is_recurring': True
-                    })
-                    transaction_id += 1
-
-    df = pd.DataFrame(data)
-    df['date'] = pd.to_datetime(df['date'])
-    return df.sort_values('date').reset_index(drop=True)
+    dates = _date_range(base_date, days)
+    return _build_frame(_cash_flow_columns(dates, account_currencies, rng, amount_dtype), backend)
+
+
+def generate_cash_flows_parallel(
+    days: int = 365,
+    n_accounts: int = 5,
+    base_date: Optional[datetime] = None,
+    seed: int = 42,
+    n_workers: Optional[int] = None,
+    backend: str = 'pandas',
+    amount_dtype: DTypeLike = np.float64
+) -> Frame:
+    """
+    Generate cash flow transaction data across worker processes.
+
+    Same columns and patterns as generate_cash_flows. The date range is split
+    into n_workers contiguous blocks, each simulated in its own process from
+    an independent child of SeedSequence(seed), and the blocks are
+    concatenated in date order. Account currencies are drawn once and shared
+    by every block.
+
+    Output is reproducible for a given (seed, n_workers) but differs from
+    generate_cash_flows with the same seed, since the random streams differ.
+    Transaction ids are renumbered after concatenation, so they stay unique
+    and in date order across blocks.
+
+    Parameters:
+    -----------
+    days, n_accounts, base_date, seed, backend, amount_dtype
+        As for generate_cash_flows
+    n_workers : int, optional
+        Number of worker processes (defaults to os.cpu_count()); capped at
+        days so that no block is empty
+    """
+    if base_date is None:
+        base_date = datetime.now() - timedelta(days=days)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_workers < 1:
+        raise ValueError(f'n_workers must be at least 1, got {n_workers}')
+    n_workers = max(1, min(n_workers, days))  # No more blocks than days
+
+    currency_seq, *block_seqs = np.random.SeedSequence(seed).spawn(n_workers + 1)
+    account_currencies = _draw_categorical(
+        np.random.default_rng(currency_seq), ['USD', 'EUR', 'TRY'], n_accounts, p=[0.4, 0.3, 0.3]
+    )
+
+    dates = _date_range(base_date, days)
+    blocks = [dates[idx] for idx in np.array_split(np.arange(days), n_workers)]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        frames = list(pool.map(
+            _cash_flow_block, blocks, repeat(account_currencies), block_seqs, repeat(backend),
+            repeat(amount_dtype)
+        ))
+
+    transaction_id = _format_ids('TXN_', np.arange(1000, 1000 + sum(len(f) for f in frames)), 8)
+    if backend == 'polars':
+        return pl.concat(frames).with_columns(pl.Series('transaction_id', transaction_id))
+    df = pd.concat(frames, ignore_index=True)
+    df['transaction_id'] = transaction_id
+    return df
+
+
+def write_cash_flows_parquet(
+    path: str,
+    days: int = 365,
+    n_accounts: int = 5,
+    base_date: Optional[datetime] = None,
+    seed: int = 42,
+    chunk_days: int = 365,
+    amount_dtype: DTypeLike = np.float64
+) -> int:
+    """
+    Generate cash flow transaction data straight into a Parquet file.
+
+    Same columns and patterns as generate_cash_flows, but the date range is
+    simulated chunk_days at a time and each chunk is appended to one Parquet
+    file, so peak memory is bounded by a chunk rather than the whole range.
+    Text columns are dictionary-encoded on disk.
+
+    Like generate_cash_flows_parallel, each chunk draws from an independent
+    child of SeedSequence(seed) and account currencies are drawn once: output
+    is reproducible for a given (seed, chunk_days) but differs from
+    generate_cash_flows with the same seed. Transaction ids run on across
+    chunks.
+
+    Parameters:
+    -----------
+    path : str
+        Parquet file to write (overwritten if it exists)
+    days, n_accounts, base_date, seed, amount_dtype
+        As for generate_cash_flows
+    chunk_days : int
+        Number of days simulated and written per chunk
+
+    Returns:
+    --------
+    Number of rows written
+    """
+    if chunk_days < 1:
+        raise ValueError(f'chunk_days must be at least 1, got {chunk_days}')
+    if pa is None:
+        raise ImportError('write_cash_flows_parquet requires the pyarrow package')
+    if base_date is None:
+        base_date = datetime.now() - timedelta(days=days)
+    n_chunks = max(1, -(-days // chunk_days))
+
+    currency_seq, *chunk_seqs = np.random.SeedSequence(seed).spawn(n_chunks + 1)
+    account_currencies = _draw_categorical(
+        np.random.default_rng(currency_seq), ['USD', 'EUR', 'TRY'], n_accounts, p=[0.4, 0.3, 0.3]
+    )
+
+    labels = pa.dictionary(pa.int8(), pa.string())
+    schema = pa.schema([
+        ('date', pa.timestamp('ns')),
+        ('account_id', pa.dictionary(pa.int32(), pa.string())),
+        ('transaction_id', pa.string()),
+        ('type', labels),
+        ('amount', pa.from_numpy_dtype(np.dtype(amount_dtype))),
+        ('currency', labels),
+        ('category', labels),
+        ('counterparty', pa.dictionary(pa.int32(), pa.string())),
+        ('description', labels),
+        ('is_recurring', pa.bool_())
+    ])
+
+    dates = _date_range(base_date, days)
+    n_rows = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for start, chunk_seq in zip(range(0, days, chunk_days), chunk_seqs):
+            columns = _cash_flow_columns(
+                dates[start:start + chunk_days], account_currencies, np.random.default_rng(chunk_seq), amount_dtype
+            )
+            n = len(columns['transaction_id'])
+            columns['transaction_id'] = _format_ids('TXN_', np.arange(1000 + n_rows, 1000 + n_rows + n), 8)
+            table = pa.Table.from_pandas(pd.DataFrame(columns, copy=False), schema=schema, preserve_index=False)
+            writer.write_table(table)
+            n_rows += n
+
+    return n_rows
+
+
+def _cash_flow_block(
+    dates: np.ndarray,
+    account_currencies: pd.Categorical,
+    seed_seq: np.random.SeedSequence,
+    backend: str,
+    amount_dtype: DTypeLike
+) -> Frame:
+    """Worker for generate_cash_flows_parallel: simulate one block of dates."""
+    rng = np.random.default_rng(seed_seq)
+    return _build_frame(_cash_flow_columns(dates, account_currencies, rng, amount_dtype), backend)
+
+
+def _cash_flow_columns(
+    dates: np.ndarray,
+    account_currencies: pd.Categorical,
+    rng: np.random.Generator,
+    amount_dtype: DTypeLike = np.float64
+) -> dict:
+    """Simulate cash flow transactions over dates for accounts with the given currencies, as column arrays."""
+    days, n_accounts = len(dates), len(account_currencies)
+    account_ids = _format_ids('ACC_', np.arange(n_accounts), 3)
+
+    # Calendar effects are per day; they broadcast across accounts only where
+    # they meet a (days, n_accounts) draw
+    shape = (days, n_accounts)
+    day_of_month, weekday, month = _calendar_fields(dates)
+
+    # Skip weekends for most transactions
+    is_business_day = weekday < 5
+
+    # Month-end effect (more transactions)
+    month_end_multiplier = np.where(day_of_month >= 25, 2.0, 1.0)
+
+    # Quarter-end effect
+    quarter_end_multiplier = np.where(np.isin(month, [3, 6, 9, 12]) & (day_of_month >= 20), 1.5, 1.0)
+
+    categories = ['RECEIVABLE', 'INTEREST', 'SUPPLIER', 'SALARY', 'TAX']
+    category_type = np.array([0, 0, 1, 1, 1])  # Codes into ['INFLOW', 'OUTFLOW']
+    is_recurring = np.array([False, True, False, True, True])
+
+    # One block of column arrays per category, in generation order
+    blocks = []
+
+    def all_accounts_on(day_mask):
+        return np.nonzero(np.broadcast_to(day_mask[:, None], shape))
+
+    def flows(category, day_idx, account_idx, amount, counterparty):
+        blocks.append((
+            np.full(len(day_idx), categories.index(category)),
+            day_idx,
+            account_idx,
+            amount,
+            np.broadcast_to(np.asarray(counterparty, dtype=object), day_idx.shape)
+        ))
+
+    # INFLOWS
+    # Customer receivables (larger, less frequent)
+    mask = is_business_day[:, None] & (rng.random(shape) < 0.3 * month_end_multiplier[:, None])
+    day_idx, account_idx = np.nonzero(mask)
+    n = len(day_idx)
+    flows(
+        'RECEIVABLE', day_idx, account_idx,
+        rng.lognormal(mean=12, sigma=1.5, size=n),  # ~$150K avg
+        _format_ids('CUST_', rng.integers(1, 50, size=n), 3)
+    )
+
+    # Interest income (small, regular)
+    day_idx, account_idx = all_accounts_on(is_business_day & (day_of_month == 1))
+    flows('INTEREST', day_idx, account_idx, rng.uniform(5000, 50000, size=len(day_idx)), 'BANK_INTEREST')
+
+    # OUTFLOWS
+    # Supplier payments (multiple per day)
+    n_supplier_payments = (rng.poisson(3, size=shape) * month_end_multiplier[:, None]).astype(np.int64)
+    n_supplier_payments[~is_business_day] = 0
+    cell = np.repeat(np.arange(days * n_accounts), n_supplier_payments.ravel())
+    day_idx, account_idx = np.divmod(cell, n_accounts)
+    n = len(cell)
+    flows(
+        'SUPPLIER', day_idx, account_idx,
+        -rng.lognormal(mean=10, sigma=1.2, size=n),  # ~$20K avg
+        _format_ids('SUPP_', rng.integers(1, 200, size=n), 3)
+    )
+
+    # Salary payments (end of month)
+    day_idx, account_idx = all_accounts_on(is_business_day & (day_of_month == 28))
+    flows('SALARY', day_idx, account_idx, -rng.uniform(500000, 2000000, size=len(day_idx)), 'PAYROLL')
+
+    # Tax payments (quarterly)
+    day_idx, account_idx = all_accounts_on(is_business_day & np.isin(month, [1, 4, 7, 10]) & (day_of_month == 15))
+    flows(
+        'TAX', day_idx, account_idx,
+        -rng.uniform(100000, 500000, size=len(day_idx)) * quarter_end_multiplier[day_idx],
+        'TAX_AUTHORITY'
+    )
+
+    # lexsort is stable, so within each day and account the category order is
+    # kept and transaction ids are numbered in the same order as generated
+    category_code, day_idx, account_idx, amount, counterparty = (np.concatenate(c) for c in zip(*blocks))
+    order = np.lexsort((account_idx, day_idx))
+    category_code, day_idx, account_idx = category_code[order], day_idx[order], account_idx[order]
+
+    return {
+        'date': dates[day_idx],
+        'account_id': account_ids[account_idx],
+        'transaction_id': _format_ids('TXN_', np.arange(1000, 1000 + len(order)), 8),
+        'type': pd.Categorical.from_codes(category_type[category_code], ['INFLOW', 'OUTFLOW']),
+        'amount': _round_amounts(amount[order], 2, amount_dtype),
+        'currency': pd.Categorical.from_codes(account_currencies.codes[account_idx], account_currencies.categories),
+        'category': pd.Categorical.from_codes(category_code, categories),
+        'counterparty': counterparty[order],
+        'description': pd.Categorical.from_codes(category_code, dtype=DESCRIPTIONS),
+        'is_recurring': is_recurring[category_code]
+    }
 
 
 def generate_daily_cash_position(
     days: int = 365,
     n_accounts: int = 5,
-    seed: int = 42
+    seed: int = 42,
+    rng: Optional[RandomSource] = None,
+    amount_dtype: DTypeLike = np.float64
 ) -> pd.DataFrame:
     """
     Generate daily cash position (balance) data.
 
     Returns aggregated end-of-day balances per account with opening/closing.
+    Balances are simulated in float64 and only the output columns are cast to
+    amount_dtype.
     """
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
     base_date = datetime.now() - timedelta(days=days)
-    data = []
+    dates = _date_range(base_date, days)
+    shape = (days, n_accounts)
 
     # Initialize account balances
-    balances = {f'ACC_{i:03d}': np.random.uniform(1_000_000, 10_000_000)
-                for i in range(n_accounts)}
-    currencies = {f'ACC_{i:03d}': np.random.choice(['USD', 'EUR', 'TRY'])
-                  for i in range(n_accounts)}
+    account_ids = _format_ids('ACC_', np.arange(n_accounts), 3)
+    initial_balances = rng.uniform(1_000_000, 10_000_000, size=n_accounts)
+    currencies = _draw_categorical(rng, ['USD', 'EUR', 'TRY'], n_accounts)
+
+    # Simulate daily movement
+    daily_inflow = np.where(rng.random(shape) > 0.3, rng.lognormal(11, 1, size=shape), 0.0)
+    daily_outflow = rng.lognormal(10.5, 1.2, size=shape)
+
+    # Add seasonality
+    day_of_month, _, _ = _calendar_fields(dates)
+    daily_outflow *= np.where(day_of_month >= 25, 1.5, 1.0)[:, None]  # Month-end
+
+    # Balances are floored at zero each day: closing = max(0, opening + net).
+    # That recursion equals the unfloored running sum lifted by its running
+    # shortfall below zero, which vectorizes over the day axis.
+    running = initial_balances + np.cumsum(daily_inflow - daily_outflow, axis=0)
+    closing = running - np.minimum(np.minimum.accumulate(running, axis=0), 0)
+    opening = np.concatenate([initial_balances[None], closing[:-1]])[:days]  # [:days] keeps days=0 empty
+
+    return pd.DataFrame({
+        'date': np.repeat(dates, n_accounts),
+        'account_id': np.tile(account_ids, days),
+        'currency': pd.Categorical.from_codes(np.tile(currencies.codes, days), currencies.categories),
+        'opening_balance': _round_amounts(opening, 2, amount_dtype).ravel(),
+        'inflows': _round_amounts(daily_inflow, 2, amount_dtype).ravel(),
+        'outflows': _round_amounts(daily_outflow, 2, amount_dtype).ravel(),
+        'closing_balance': _round_amounts(closing, 2, amount_dtype).ravel()
+    }, copy=False)
 
-    for day_offset in range(days):
-        current_date = base_date + timedelta(days=day_offset)
 
-        for account_id in balances.keys():
-            opening = balances[account_id]
+# =============================================================================
+# FX DATA GENERATORS
+# =============================================================================
 
-            # Simulate daily movement
-            daily_inflow = np.random.lognormal(11, 1) if np.random.random() > 0.3 else 0
-            daily_outflow = np.random.lognormal(10.5, 1.2)
+@njit
+def _fx_walk(base_rate, vol, noise, vol_noise):
+    """
+    Run the FX random walk for one pair over precomputed standard normal draws.
 
-            # Add seasonality
-            if current_date.day >= 25:  # Month-end
-                daily_outflow *= 1.5
+    Returns the mid rate array of len(noise).
+    """
+    n = len(noise)
+    mid = np.empty(n, dtype=np.float64)
 
-            net_change = daily_inflow - daily_outflow
-            closing = max(0, opening + net_change)
+    prev_rate = base_rate
+    for i in range(n):
+        # Volatility clustering
+        if i > 0:
+            vol_multiplier = 1 + 0.5 * abs(vol_noise[i])
+        else:
+            vol_multiplier = 1.0
 
-            data.append({
-                'date': current_date,
-                'account_id': account_id,
-                'currency': currencies[account_id],
-                'opening_balance': round(opening, 2),
-                'inflows': round(daily_inflow, 2),
-                'outflows': round(daily_outflow, 2),
-                'closing_balance': round(closing, 2)
-            })
+        # Random walk
+        daily_return = 0.0001 + vol * vol_multiplier * noise[i]
+        rate = prev_rate * (1 + daily_return)
 
-            balances[account_id] = closing
+        # Add mean reversion for extreme moves
+        if abs(rate / base_rate - 1) > 0.1:
+            rate = rate * 0.99 + base_rate * 0.01
 
-    return pd.DataFrame(data)
+        mid[i] = rate
+        prev_rate = rate
 
+    return mid
 
-# =============================================================================
-# FX DATA GENERATORS
-# =============================================================================
 
 def generate_fx_rates(
     days: int = 365,
     currency_pairs: List[str] = None,
     freq: str = 'D',
-    seed: int = 42
+    seed: int = 42,
+    rng: Optional[RandomSource] = None,
+    amount_dtype: DTypeLike = np.float64
 ) -> pd.DataFrame:
     """
     Generate realistic FX rate time series with volatility clustering.
@@ -268,13 +598,19 @@ def generate_fx_rates(
         Frequency ('D' for daily, 'H' for hourly)
     seed : int
         Random seed
+    rng : np.random.Generator or np.random.SeedSequence, optional
+        Random stream to draw from instead of seed, e.g. a child sequence
+        spawned per worker process
+    amount_dtype : numpy dtype
+        dtype of the rate columns (default float64). float32 cannot hold six
+        decimals on rates above ~10 (e.g. USD/TRY)
 
     Returns:
     --------
     pd.DataFrame with columns:
         timestamp, currency_pair, bid, ask, mid, daily_change_pct
     """
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
     if currency_pairs is None:
         currency_pairs = ['USD/TRY', 'EUR/TRY', 'EUR/USD', 'GBP/USD']
@@ -306,112 +642,165 @@ def generate_fx_rates(
 
     base_date = datetime.now() - timedelta(days=days)
     periods = days if freq == 'D' else days * 24
-
-    data = []
-
-    for pair in currency_pairs:
-        rate = base_rates.get(pair, 1.0)
-        vol = volatilities.get(pair, 0.01)
-        spread = spreads.get(pair, 0.001)
-
-        prev_rate = rate
-
-        for i in range(periods):
-            if freq == 'D':
-                timestamp = base_date + timedelta(days=i)
-            else:
-                timestamp = base_date + timedelta(hours=i)
-
-            # Volatility clustering
-            if i > 0:
-                vol_multiplier = 1 + 0.5 * abs(np.random.normal(0, 1))
-            else:
-                vol_multiplier = 1
-
-            # Random walk
-            daily_return = np.random.normal(0.0001, vol * vol_multiplier)
-            rate = prev_rate * (1 + daily_return)
-
-            # Add mean reversion for extreme moves
-            if abs(rate / base_rates.get(pair, 1.0) - 1) > 0.1:
-                rate = rate * 0.99 + base_rates.get(pair, 1.0) * 0.01
-
-            mid = rate
-            bid = mid * (1 - spread/2)
-            ask = mid * (1 + spread/2)
-
-            daily_change = (rate - prev_rate) / prev_rate * 100 if prev_rate else 0
-
-            data.append({
-                'timestamp': timestamp,
-                'currency_pair': pair,
-                'bid': round(bid, 6),
-                'ask': round(ask, 6),
-                'mid': round(mid, 6),
-                'daily_change_pct': round(daily_change, 4)
-            })
-
-            prev_rate = rate
-
-    return pd.DataFrame(data)
+    timestamps = _date_range(base_date, periods, 'D' if freq == 'D' else 'h')
+
+    n_pairs = len(currency_pairs)
+    base = np.array([base_rates.get(pair, 1.0) for pair in currency_pairs])
+    spread = np.array([spreads.get(pair, 0.001) for pair in currency_pairs])
+
+    # Only the walk itself is sequential; one row of mid rates per pair
+    mid = np.empty((n_pairs, periods))
+    for j, pair in enumerate(currency_pairs):
+        noise = rng.standard_normal(periods)
+        vol_noise = rng.standard_normal(periods)
+        mid[j] = _fx_walk(base[j], volatilities.get(pair, 0.01), noise, vol_noise)
+
+    # Quotes and changes for every pair at once; the first change is measured
+    # against the base rate
+    bid = mid * (1 - spread[:, None] / 2)
+    ask = mid * (1 + spread[:, None] / 2)
+    prev = np.hstack([base[:, None], mid[:, :-1]])
+    daily_change = (mid - prev) / prev * 100
+
+    return pd.DataFrame({
+        'timestamp': np.tile(timestamps, n_pairs),
+        'currency_pair': pd.Categorical.from_codes(np.repeat(np.arange(n_pairs), periods), currency_pairs),
+        'bid': _round_amounts(bid, 6, amount_dtype).ravel(),
+        'ask': _round_amounts(ask, 6, amount_dtype).ravel(),
+        'mid': _round_amounts(mid, 6, amount_dtype).ravel(),
+        'daily_change_pct': _round_amounts(daily_change, 4, amount_dtype).ravel()
+    }, copy=False)
 
 
 def generate_fx_exposures(
     n_exposures: int = 100,
-    seed: int = 42
+    seed: int = 42,
+    rng: Optional[RandomSource] = None
 ) -> pd.DataFrame:
     """
     Generate FX exposure data (forecasted cash flows by currency).
     """
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
-    data = []
     base_date = datetime.now()
 
     currencies = ['USD', 'EUR', 'GBP', 'TRY']
     exposure_types = ['RECEIVABLE', 'PAYABLE', 'FORECAST_REVENUE', 'FORECAST_COST']
     entities = [f'ENTITY_{i:02d}' for i in range(1, 6)]
 
-    for i in range(n_exposures):
-        maturity_days = np.random.choice([30, 60, 90, 180, 365])
-        currency = np.random.choice(currencies, p=[0.4, 0.3, 0.1, 0.2])
+    maturities = np.array([30, 60, 90, 180, 365])
+
+    n = n_exposures
+    maturity = _draw_categorical(rng, [f'{d}D' for d in maturities], n)
+    maturity_days = maturities[maturity.codes]
+    currency = _draw_categorical(rng, currencies, n, p=[0.4, 0.3, 0.1, 0.2])
+
+    # USD payables (crude purchases) dominate
+    exp_type = pd.Categorical.from_codes(np.where(
+        currency == 'USD',
+        rng.choice(len(exposure_types), size=n, p=[0.2, 0.6, 0.1, 0.1]),
+        rng.choice(len(exposure_types), size=n, p=[0.5, 0.2, 0.2, 0.1])
+    ), exposure_types)
+
+    amount = np.where(
+        exp_type.isin(['PAYABLE', 'FORECAST_COST']),
+        -rng.lognormal(15, 1, size=n),  # Negative for payables
+        rng.lognormal(14, 1.2, size=n)
+    )
+
+    hedge_ratio = rng.uniform(0.5, 1.0, size=n)
+
+    return pd.DataFrame({
+        'exposure_id': _format_ids('EXP_', np.arange(1, n + 1), 5),
+        'entity': _draw_categorical(rng, entities, n),
+        'currency': currency,
+        'exposure_type': exp_type,
+        'amount_local': np.round(amount, 2),
+        'maturity_date': np.datetime64(base_date, 'ns') + maturity_days.astype('timedelta64[D]'),
+        'maturity_bucket': maturity,
+        'is_hedged': rng.random(n) > 0.6,
+        'hedge_ratio': np.where(rng.random(n) > 0.6, hedge_ratio, 0)
+    }, copy=False)
 
-        # USD payables (crude purchases) dominate
-        if currency == 'USD':
-            exp_type = np.random.choice(exposure_types, p=[0.2, 0.6, 0.1, 0.1])
-        else:
-            exp_type = np.random.choice(exposure_types, p=[0.5, 0.2, 0.2, 0.1])
 
-        if exp_type in ['PAYABLE', 'FORECAST_COST']:
-            amount = -np.random.lognormal(15, 1)  # Negative for payables
+# =============================================================================
+# PAYMENT DATA GENERATORS
+# =============================================================================
+
+# Payment anomaly reasons in reporting order; reason i is bit 1 << i of a reason mask
+ANOMALY_REASONS = ['NEW_BENEFICIARY', 'UNUSUAL_AMOUNT', 'ROUND_AMOUNT', 'HIGH_RISK_COUNTRY', 'UNUSUAL_TIME']
+_NEW_BENEFICIARY, _UNUSUAL_AMOUNT, _ROUND_AMOUNT, _HIGH_RISK_COUNTRY, _UNUSUAL_TIME = 1, 2, 4, 8, 16
+
+# Pipe-joined label and reason count for every possible mask
+_ANOMALY_LABELS = np.array([
+    '|'.join(r for i, r in enumerate(ANOMALY_REASONS) if mask >> i & 1) or None
+    for mask in range(1 << len(ANOMALY_REASONS))
+], dtype=object)
+_ANOMALY_COUNTS = np.array([bin(mask).count('1') for mask in range(1 << len(ANOMALY_REASONS))])
+
+
+@njit
+def _payment_anomalies(is_anomaly, draws, pool_country, new_country, high_risk):
+    """
+    Apply the payment anomaly rules to pre-drawn uniforms.
+
+    draws is a (4, n) array deciding, for anomalous payments, a new
+    beneficiary, an unusual amount, a round amount and an unusual time.
+    Returns (reasons, is_anomaly, round_amount, country): the int8 reason mask,
+    the final label (high-risk countries are always anomalous), whether the
+    amount is rounded to the nearest 10000, and the beneficiary country code.
+    """
+    n = len(is_anomaly)
+    reasons = np.zeros(n, dtype=np.int8)
+    flagged = np.empty(n, dtype=np.bool_)
+    round_amount = np.zeros(n, dtype=np.bool_)
+    country = np.empty(n, dtype=np.int64)
+
+    for i in range(n):
+        anomalous = is_anomaly[i]
+        mask = 0
+
+        # Select beneficiary
+        if anomalous and draws[0, i] < 0.3:
+            mask |= _NEW_BENEFICIARY
+            country[i] = new_country[i]
         else:
-            amount = np.random.lognormal(14, 1.2)
+            country[i] = pool_country[i]
 
-        data.append({
-            'exposure_id': f'EXP_{i+1:05d}',
-            'entity': np.random.choice(entities),
-            'currency': currency,
-            'exposure_type': exp_type,
-            'amount_local': round(amount, 2),
-            'maturity_date': base_date + timedelta(days=int(maturity_days)),
-            'maturity_bucket': f'{maturity_days}D',
-            'is_hedged': np.random.random() > 0.6,
-            'hedge_ratio': np.random.uniform(0.5, 1.0) if np.random.random() > 0.6 else 0
-        })
+        # Generate amount
+        if anomalous and draws[1, i] < 0.4:
+            mask |= _UNUSUAL_AMOUNT
 
-    return pd.DataFrame(data)
+        # Round amount anomaly
+        if anomalous and draws[2, i] < 0.3:
+            round_amount[i] = True
+            if not mask & _UNUSUAL_AMOUNT:
+                mask |= _ROUND_AMOUNT
 
+        # High-risk country
+        if high_risk[country[i]]:
+            mask |= _HIGH_RISK_COUNTRY
+            anomalous = True
+
+        # Generate timestamp
+        if anomalous and draws[3, i] < 0.2:
+            mask |= _UNUSUAL_TIME
+
+        reasons[i] = mask
+        flagged[i] = anomalous
+
+    return reasons, flagged, round_amount, country
 
-# =============================================================================
-# PAYMENT DATA GENERATORS
-# =============================================================================
 
 def generate_payments(
     days: int = 90,
     daily_count: int = 50,
     anomaly_rate: float = 0.02,
-    seed: int = 42
-) -> pd.DataFrame:
+    seed: int = 42,
+    rng: Optional[RandomSource] = None,
+    backend: str = 'pandas',
+    amount_dtype: DTypeLike = np.float64
+) -> Frame:
     """
     Generate payment transaction data with labeled anomalies.
 
@@ -432,105 +821,145 @@ def generate_payments(
         Proportion of anomalous payments
     seed : int
         Random seed
+    rng : np.random.Generator or np.random.SeedSequence, optional
+        Random stream to draw from instead of seed, e.g. a child sequence
+        spawned per worker process
+    backend : str
+        'pandas' (default) or 'polars' to return a polars DataFrame
+    amount_dtype : numpy dtype
+        dtype of the amount columns (default float64). float32 halves their
+        memory but keeps only ~7 significant digits; see _round_amounts
 
     Returns:
     --------
-    pd.DataFrame with fraud labels and anomaly reasons
+    DataFrame with fraud labels and anomaly reasons
     """
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
-    data = []
     base_date = datetime.now() - timedelta(days=days)
 
-    # Normal beneficiary pool
-    beneficiaries = [
-        {'name': f'SUPPLIER_{i:03d}', 'country': np.random.choice(['TR', 'US', 'DE', 'GB', 'NL']),
-         'account': f'IBAN{i:010d}', 'avg_amount': np.random.lognormal(10, 1)}
-        for i in range(200)
-    ]
-
     high_risk_countries = ['RU', 'IR', 'KP', 'SY', 'VE']
+    countries = ['TR', 'US', 'DE', 'GB', 'NL'] + high_risk_countries
+
+    # Normal beneficiary pool, one array per attribute (countries are codes
+    # into the low-risk head of countries). Names and accounts are object
+    # arrays so new vendors' longer strings can be written into them.
+    n_pool = 200
+    pool_name = _format_ids('SUPPLIER_', np.arange(n_pool), 3).astype(object)
+    pool_account = _format_ids('IBAN', np.arange(n_pool), 10).astype(object)
+    pool_country = rng.integers(0, 5, size=n_pool)
+    pool_avg_amount = rng.lognormal(10, 1, size=n_pool)
+
+    # Countries a new/unknown beneficiary can be in
+    new_countries = np.array([countries.index(c) for c in high_risk_countries + ['TR', 'US']])
+
+    # Skip weekends
+    dates = _date_range(base_date, days)
+    _, weekday, _ = _calendar_fields(dates)
+    business_days = np.flatnonzero(weekday < 5)
+
+    # Size every column up front from the per-day payment counts
+    n_payments = rng.poisson(daily_count, size=len(business_days))
+    total = int(n_payments.sum())
+    day_offset = np.repeat(business_days, n_payments)
+    seq_in_day = np.arange(total) - np.repeat(np.cumsum(n_payments) - n_payments, n_payments)
+
+    # Candidate beneficiaries: a pool pick, and the country a new one would have
+    pool_idx = rng.integers(n_pool, size=total)
+    new_country = new_countries[rng.integers(len(new_countries), size=total)]
+
+    reasons, is_anomaly, round_amount, country = _payment_anomalies(
+        rng.random(total) < anomaly_rate,
+        rng.random((4, total)),
+        pool_country[pool_idx],
+        new_country,
+        np.isin(countries, high_risk_countries)
+    )
+    is_new = (reasons & _NEW_BENEFICIARY) != 0
+    n_new = int(is_new.sum())
+
+    # Generate amount
+    avg_amount = np.where(is_new, 50000, pool_avg_amount[pool_idx])
+    amount = avg_amount * np.where(
+        (reasons & _UNUSUAL_AMOUNT) != 0,
+        rng.uniform(5, 20, size=total),
+        rng.lognormal(0, 0.5, size=total)
+    )
+    amount = np.where(round_amount, np.round(amount, -4), amount)  # Round to nearest 10000
+
+    # Generate timestamp hour
+    hour = np.where(
+        (reasons & _UNUSUAL_TIME) != 0,
+        rng.choice([2, 3, 4, 22, 23], size=total),
+        rng.integers(9, 18, size=total)
+    )
+
+    # New/unknown beneficiaries
+    beneficiary_name = pool_name[pool_idx]
+    beneficiary_account = pool_account[pool_idx]
+    beneficiary_name[is_new] = np.char.add('NEW_VENDOR_', _random_tokens(rng, string.ascii_uppercase, n_new, 5))
+    beneficiary_account[is_new] = np.char.add('IBAN_NEW_', rng.integers(1000000, 9999999, size=n_new).astype(str))
+
+    # Payments keep the seconds of base_date but take their own hour and minute
+    day_start = np.datetime64(base_date.replace(hour=0, minute=0), 'ns')
+    timestamp = (day_start + day_offset.astype('timedelta64[D]') + hour.astype('timedelta64[h]')
+                 + rng.integers(0, 60, size=total).astype('timedelta64[m]'))
+
+    return _build_frame({
+        'payment_id': np.char.add(_format_ids('PAY_', day_offset, 3), _format_ids('_', seq_in_day, 4)),
+        'timestamp': timestamp,
+        'amount': _round_amounts(amount, 2, amount_dtype),
+        'currency': _draw_categorical(rng, ['USD', 'EUR', 'TRY'], total, p=[0.5, 0.3, 0.2]),
+        'beneficiary_name': beneficiary_name,
+        'beneficiary_account': beneficiary_account,
+        'beneficiary_country': pd.Categorical.from_codes(country, countries),
+        'payment_type': _draw_categorical(rng, ['SUPPLIER', 'SALARY', 'TAX', 'TRANSFER'], total),
+        'initiated_by': _format_ids('USER_', rng.integers(1, 20, size=total), 2),
+        'is_anomaly': is_anomaly,
+        'anomaly_reasons': _ANOMALY_LABELS[reasons],
+        'anomaly_score': _ANOMALY_COUNTS[reasons] / 5
+    }, backend)
 
-    for day_offset in range(days):
-        current_date = base_date + timedelta(days=day_offset)
-
-        # Skip weekends
-        if current_date.weekday() >= 5:
-            continue
-
-        n_payments = np.random.poisson(daily_count)
-
-        for i in range(n_payments):
-            is_anomaly = np.random.random() < anomaly_rate
-            anomaly_reasons = []
-
-            # Select beneficiary
-            if is_anomaly and np.random.random() < 0.3:
-                # New/unknown beneficiary
-                beneficiary = {
-                    'name': f'NEW_VENDOR_{"".join(random.choices(string.ascii_uppercase, k=5))}',
-                    'country': np.random.choice(high_risk_countries + ['TR', 'US']),
-                    'account': f'IBAN_NEW_{np.random.randint(1000000, 9999999)}',
-                    'avg_amount': 50000
-                }
-                anomaly_reasons.append('NEW_BENEFICIARY')
-            else:
-                beneficiary = random.choice(beneficiaries)
 
-            # Generate amount
-            if is_anomaly and np.random.random() < 0.4:
-                amount = beneficiary['avg_amount'] * np.random.uniform(5, 20)
-                anomaly_reasons.append('UNUSUAL_AMOUNT')
-            else:
-                amount = beneficiary['avg_amount'] * np.random.lognormal(0, 0.5)
-
-            # Round amount anomaly
-            if is_anomaly and np.random.random() < 0.3:
-                amount = round(amount, -4)  # Round to nearest 10000
-                if 'UNUSUAL_AMOUNT' not in anomaly_reasons:
-                    anomaly_reasons.append('ROUND_AMOUNT')
-
-            # High-risk country
-            if beneficiary['country'] in high_risk_countries:
-                anomaly_reasons.append('HIGH_RISK_COUNTRY')
-                is_anomaly = True
-
-            # Generate timestamp
-            if is_anomaly and np.random.random() < 0.2:
-                hour = np.random.choice([2, 3, 4, 22, 23])
-                anomaly_reasons.append('UNUSUAL_TIME')
-            else:
-                hour = np.random.randint(9, 18)
+# =============================================================================
+# COMMODITY DATA GENERATORS
+# =============================================================================
 
-            timestamp = current_date.replace(hour=hour, minute=np.random.randint(0, 60))
+@njit
+def _commodity_walk(base, daily_return):
+    """
+    Compound a (days, n_commodities) return matrix into prices starting at base.
 
-            data.append({
-                'payment_id': f'PAY_{day_offset:03d}_{i:04d}',
-                'timestamp': timestamp,
-                'amount': round(amount, 2),
-                'currency': np.random.choice(['USD', 'EUR', 'TRY'], p=[0.5, 0.3, 0.2]),
-                'beneficiary_name': beneficiary['name'],
-                'beneficiary_account': beneficiary['account'],
-                'beneficiary_country': beneficiary['country'],
-                'payment_type': np.random.choice(['SUPPLIER', 'SALARY', 'TAX', 'TRANSFER']),
-                'initiated_by': f'USER_{np.random.randint(1, 20):02d}',
-                'is_anomaly': is_anomaly,
-                'anomaly_reasons': '|'.join(anomaly_reasons) if anomaly_reasons else None,
-                'anomaly_score': len(anomaly_reasons) / 5 if anomaly_reasons else 0
-            })
+    Prices more than 30% away from base are pulled back towards it each day.
+    The pull depends on the previous day's price, so this runs as a loop over
+    days rather than a cumulative product.
+    """
+    days, n_commodities = daily_return.shape
+    prices = np.empty((days, n_commodities), dtype=np.float64)
+    current = base.copy()
 
-    return pd.DataFrame(data)
+    for t in range(days):
+        for j in range(n_commodities):
+            price = current[j] * (1 + daily_return[t, j])
 
+            # Mean reversion
+            if abs(price / base[j] - 1) > 0.3:
+                price = price * 0.98 + base[j] * 0.02
+
+            prices[t, j] = price
+            current[j] = price
+
+    return prices
 
-# =============================================================================
-# COMMODITY DATA GENERATORS
-# =============================================================================
 
 def generate_commodity_prices(
     days: int = 365,
     commodities: List[str] = None,
-    seed: int = 42
-) -> pd.DataFrame:
+    seed: int = 42,
+    rng: Optional[RandomSource] = None,
+    backend: str = 'pandas',
+    amount_dtype: DTypeLike = np.float64
+) -> Tuple[Frame, Frame]:
     """
     Generate commodity price time series (crude oil, products).
 
@@ -539,8 +968,13 @@ def generate_commodity_prices(
     - Crack spreads
     - Seasonality (driving season, winter heating)
     - Volatility regimes
+
+    Returns (prices, wide) where prices is the long OHLCV table and wide has
+    one close column per commodity plus crack spreads. backend='polars'
+    returns both as polars DataFrames. Price columns (and the crack spreads
+    derived from them) are cast to amount_dtype.
     """
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
     if commodities is None:
         commodities = ['BRENT', 'WTI', 'GASOLINE', 'DIESEL', 'JET_FUEL']
@@ -562,68 +996,60 @@ def generate_commodity_prices(
     }
 
     base_date = datetime.now() - timedelta(days=days)
-    data = []
-
-    # Track prices for correlation
-    prices = {c: base_prices[c] for c in commodities}
-
-    for day_offset in range(days):
-        current_date = base_date + timedelta(days=day_offset)
-        month = current_date.month
-
-        # Common shock (affects all commodities)
-        common_shock = np.random.normal(0, 0.01)
-
-        # Seasonality
-        if month in [6, 7, 8]:  # Driving season
-            gasoline_seasonal = 0.001
-        else:
-            gasoline_seasonal = -0.0005
-
-        if month in [11, 12, 1, 2]:  # Winter heating
-            diesel_seasonal = 0.0008
-        else:
-            diesel_seasonal = -0.0003
-
-        for commodity in commodities:
-            vol = volatilities[commodity]
-            idiosyncratic = np.random.normal(0, vol)
-
-            # Add seasonal effects
-            seasonal = 0
-            if commodity == 'GASOLINE':
-                seasonal = gasoline_seasonal
-            elif commodity in ['DIESEL', 'JET_FUEL']:
-                seasonal = diesel_seasonal
-
-            # Update price
-            daily_return = common_shock * 0.7 + idiosyncratic * 0.3 + seasonal
-            prices[commodity] = prices[commodity] * (1 + daily_return)
-
-            # Mean reversion
-            base = base_prices[commodity]
-            if abs(prices[commodity] / base - 1) > 0.3:
-                prices[commodity] = prices[commodity] * 0.98 + base * 0.02
-
-            data.append({
-                'date': current_date,
-                'commodity': commodity,
-                'close': round(prices[commodity], 4),
-                'open': round(prices[commodity] * (1 + np.random.uniform(-0.01, 0.01)), 4),
-                'high': round(prices[commodity] * (1 + abs(np.random.normal(0, 0.015))), 4),
-                'low': round(prices[commodity] * (1 - abs(np.random.normal(0, 0.015))), 4),
-                'volume': int(np.random.lognormal(15, 1))
-            })
-
-    df = pd.DataFrame(data)
+    dates = _date_range(base_date, days)
+    _, _, month = _calendar_fields(dates)
+    n_commodities = len(commodities)
+    shape = (days, n_commodities)
+
+    base = np.array([base_prices[c] for c in commodities])
+    vols = np.array([volatilities[c] for c in commodities])
+
+    # Common shock (affects all commodities)
+    common_shock = rng.normal(0, 0.01, size=days)
+    idiosyncratic = rng.normal(0, vols, size=shape)
+
+    # Seasonality
+    gasoline_seasonal = np.where(np.isin(month, [6, 7, 8]), 0.001, -0.0005)  # Driving season
+    diesel_seasonal = np.where(np.isin(month, [11, 12, 1, 2]), 0.0008, -0.0003)  # Winter heating
+    seasonal = np.zeros(shape)
+    for j, commodity in enumerate(commodities):
+        if commodity == 'GASOLINE':
+            seasonal[:, j] = gasoline_seasonal
+        elif commodity in ['DIESEL', 'JET_FUEL']:
+            seasonal[:, j] = diesel_seasonal
+
+    daily_return = common_shock[:, None] * 0.7 + idiosyncratic * 0.3 + seasonal
+    prices = _commodity_walk(base, daily_return)
+    close = _round_amounts(prices, 4, amount_dtype)
+
+    df = _build_frame({
+        'date': np.repeat(dates, n_commodities),
+        'commodity': pd.Categorical.from_codes(np.tile(np.arange(n_commodities), days), commodities),
+        'close': close.ravel(),
+        'open': _round_amounts(prices * (1 + rng.uniform(-0.01, 0.01, size=shape)), 4, amount_dtype).ravel(),
+        'high': _round_amounts(prices * (1 + np.abs(rng.normal(0, 0.015, size=shape))), 4, amount_dtype).ravel(),
+        'low': _round_amounts(prices * (1 - np.abs(rng.normal(0, 0.015, size=shape))), 4, amount_dtype).ravel(),
+        'volume': rng.lognormal(15, 1, size=shape).astype(np.int64).ravel()
+    }, backend)
+
+    # The (days, n_commodities) close matrix already is the date x commodity
+    # table, so the wide frame is built from it directly rather than pivoted.
+    # Columns are in alphabetical order, as a pivot on commodity names gave.
+    # Each column is copied out of the matrix so that the wide frame does not
+    # share memory with the long frame's close column.
+    wide = {c: np.ascontiguousarray(close[:, commodities.index(c)]) for c in sorted(commodities)}
 
     # Calculate crack spreads
-    df_pivot = df.pivot(index='date', columns='commodity', values='close')
-    if 'BRENT' in df_pivot.columns and 'GASOLINE' in df_pivot.columns:
-        df_pivot['GASOLINE_CRACK'] = df_pivot['GASOLINE'] * 42 - df_pivot['BRENT']  # 42 gal/barrel
-    if 'BRENT' in df_pivot.columns and 'DIESEL' in df_pivot.columns:
-        df_pivot['DIESEL_CRACK'] = df_pivot['DIESEL'] * 42 - df_pivot['BRENT']
+    if 'BRENT' in wide and 'GASOLINE' in wide:
+        wide['GASOLINE_CRACK'] = wide['GASOLINE'] * 42 - wide['BRENT']  # 42 gal/barrel
+    if 'BRENT' in wide and 'DIESEL' in wide:
+        wide['DIESEL_CRACK'] = wide['DIESEL'] * 42 - wide['BRENT']
+
+    if backend == 'polars':
+        return df, _build_frame({'date': dates, **wide}, backend)
 
+    df_pivot = pd.DataFrame(wide, index=pd.DatetimeIndex(dates, name='date'), copy=False)
+    df_pivot.columns.name = 'commodity'
     return df, df_pivot
 
 
@@ -631,84 +1057,77 @@ def generate_commodity_prices(
 # SUPPORTING DATA GENERATORS
 # =============================================================================
 
-def generate_counterparties(n: int = 100, seed: int = 42) -> pd.DataFrame:
+def generate_counterparties(n: int = 100, seed: int = 42, rng: Optional[RandomSource] = None) -> pd.DataFrame:
     """Generate counterparty master data."""
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
     countries = ['TR', 'US', 'DE', 'GB', 'NL', 'FR', 'IT', 'ES', 'AE', 'SG']
     types = ['CUSTOMER', 'SUPPLIER', 'BANK', 'INTERCOMPANY']
 
-    data = []
-    for i in range(n):
-        cp_type = np.random.choice(types, p=[0.3, 0.5, 0.1, 0.1])
-        data.append({
-            'counterparty_id': f'CP_{i+1:05d}',
-            'name': f'{cp_type[:4]}_{i+1:03d}_LLC',
-            'type': cp_type,
-            'country': np.random.choice(countries),
-            'credit_rating': np.random.choice(['AAA', 'AA', 'A', 'BBB', 'BB', 'B'],
-                                              p=[0.05, 0.1, 0.25, 0.35, 0.15, 0.1]),
-            'credit_limit': round(np.random.lognormal(14, 1), -3),
-            'payment_terms': np.random.choice([30, 45, 60, 90]),
-            'is_active': np.random.random() > 0.1
-        })
-
-    return pd.DataFrame(data)
-
-
-def generate_bank_accounts(n: int = 10, seed: int = 42) -> pd.DataFrame:
+    cp_type = _draw_categorical(rng, types, n, p=[0.3, 0.5, 0.1, 0.1])
+    name_prefix = np.array([t[:4] for t in types])[cp_type.codes]
+
+    return pd.DataFrame({
+        'counterparty_id': _format_ids('CP_', np.arange(1, n + 1), 5),
+        'name': np.char.add(np.char.add(name_prefix, _format_ids('_', np.arange(1, n + 1), 3)), '_LLC'),
+        'type': cp_type,
+        'country': _draw_categorical(rng, countries, n),
+        'credit_rating': _draw_categorical(rng, ['AAA', 'AA', 'A', 'BBB', 'BB', 'B'], n,
+                                           p=[0.05, 0.1, 0.25, 0.35, 0.15, 0.1]),
+        'credit_limit': np.round(rng.lognormal(14, 1, size=n), -3),
+        'payment_terms': rng.choice([30, 45, 60, 90], size=n),
+        'is_active': rng.random(n) > 0.1
+    }, copy=False)
+
+
+def generate_bank_accounts(n: int = 10, seed: int = 42, rng: Optional[RandomSource] = None) -> pd.DataFrame:
     """Generate bank account master data."""
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
     banks = ['HSBC', 'Citi', 'JPMorgan', 'Deutsche', 'Barclays', 'Garanti', 'Akbank']
     currencies = ['USD', 'EUR', 'TRY', 'GBP']
 
-    data = []
-    for i in range(n):
-        data.append({
-            'account_id': f'ACC_{i:03d}',
-            'bank': np.random.choice(banks),
-            'currency': np.random.choice(currencies),
-            'account_number': f'{"".join(random.choices(string.digits, k=16))}',
-            'iban': f'TR{"".join(random.choices(string.digits, k=24))}',
-            'account_type': np.random.choice(['OPERATING', 'PAYROLL', 'TAX', 'INVESTMENT']),
-            'entity': f'ENTITY_{np.random.randint(1, 5):02d}',
-            'is_active': True
-        })
-
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'account_id': _format_ids('ACC_', np.arange(n), 3),
+        'bank': _draw_categorical(rng, banks, n),
+        'currency': _draw_categorical(rng, currencies, n),
+        'account_number': _random_tokens(rng, string.digits, n, 16),
+        'iban': np.char.add('TR', _random_tokens(rng, string.digits, n, 24)),
+        'account_type': _draw_categorical(rng, ['OPERATING', 'PAYROLL', 'TAX', 'INVESTMENT'], n),
+        'entity': _format_ids('ENTITY_', rng.integers(1, 5, size=n), 2),
+        'is_active': np.ones(n, dtype=bool)
+    }, copy=False)
 
 
 # =============================================================================
 # DOCUMENT DATA GENERATORS
 # =============================================================================
 
-def generate_trade_documents(n: int = 50, seed: int = 42) -> pd.DataFrame:
+def generate_trade_documents(n: int = 50, seed: int = 42, rng: Optional[RandomSource] = None) -> pd.DataFrame:
     """Generate trade finance document metadata."""
-    set_seed(seed)
+    rng = _get_rng(seed, rng)
 
     doc_types = ['LC', 'BILL_OF_LADING', 'COMMERCIAL_INVOICE', 'CERTIFICATE_OF_ORIGIN']
     statuses = ['DRAFT', 'SUBMITTED', 'APPROVED', 'DISCREPANT', 'PAID']
 
-    data = []
     base_date = datetime.now() - timedelta(days=180)
 
-    for i in range(n):
-        doc_type = np.random.choice(doc_types, p=[0.3, 0.25, 0.3, 0.15])
-        days_offset = np.random.randint(0, 180)
-
-        data.append({
-            'document_id': f'DOC_{i+1:05d}',
-            'document_type': doc_type,
-            'reference_number': f'REF_{np.random.randint(100000, 999999)}',
-            'counterparty': f'SUPP_{np.random.randint(1, 50):03d}',
-            'amount': round(np.random.lognormal(14, 1), 2),
-            'currency': np.random.choice(['USD', 'EUR']),
-            'issue_date': base_date + timedelta(days=days_offset),
-            'expiry_date': base_date + timedelta(days=days_offset + np.random.randint(30, 180)),
-            'status': np.random.choice(statuses, p=[0.1, 0.2, 0.4, 0.15, 0.15]),
-            'has_discrepancy': np.random.random() < 0.15,
-            'vessel_name': f'MV {"".join(random.choices(string.ascii_uppercase, k=8))}' if doc_type == 'BILL_OF_LADING' else None
-        })
-
-    return pd.DataFrame(data)
+    doc_type = _draw_categorical(rng, doc_types, n, p=[0.3, 0.25, 0.3, 0.15])
+    days_offset = rng.integers(0, 180, size=n)
+    validity_days = rng.integers(30, 180, size=n)
+    vessel_name = np.char.add('MV ', _random_tokens(rng, string.ascii_uppercase, n, 8)).astype(object)
+    issue_date = np.datetime64(base_date, 'ns') + days_offset.astype('timedelta64[D]')
+
+    return pd.DataFrame({
+        'document_id': _format_ids('DOC_', np.arange(1, n + 1), 5),
+        'document_type': doc_type,
+        'reference_number': np.char.add('REF_', rng.integers(100000, 999999, size=n).astype(str)),
+        'counterparty': _format_ids('SUPP_', rng.integers(1, 50, size=n), 3),
+        'amount': np.round(rng.lognormal(14, 1, size=n), 2),
+        'currency': _draw_categorical(rng, ['USD', 'EUR'], n),
+        'issue_date': issue_date,
+        'expiry_date': issue_date + validity_days.astype('timedelta64[D]'),
+        'status': _draw_categorical(rng, statuses, n, p=[0.1, 0.2, 0.4, 0.15, 0.15]),
+        'has_discrepancy': rng.random(n) < 0.15,
+        'vessel_name': np.where(doc_type == 'BILL_OF_LADING', vessel_name, None)
+    }, copy=False)